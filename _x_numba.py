@@ -0,0 +1,293 @@
+"""
+Numba-compiled scalar kernel for x(t,c).
+
+The elliptic primitives (Carlson-R_F K(m), Landen-transform Jacobi sn)
+live in elliptic_nb; with those compiled, the whole piecewise evaluator
+runs as native code with no CPython or scipy dispatch in the
+segment-iteration loop.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+from elliptic_nb import ellipj_sn as _ellipj_sn
+from elliptic_nb import ellipk as _ellipk
+
+PI = math.pi
+PI_OVER_2 = math.pi / 2.0
+
+
+@njit(cache=True)
+def ellipk_series(m: float) -> float:
+    """Series approximation of K(m) for small m (very accurate for m<=0.1)."""
+    m2 = m * m
+    m3 = m2 * m
+    m4 = m2 * m2
+    m5 = m4 * m
+    return PI_OVER_2 * (
+        1.0
+        + 0.25 * m
+        + (9.0 / 64.0) * m2
+        + (25.0 / 256.0) * m3
+        + (1225.0 / 16384.0) * m4
+        + (3969.0 / 65536.0) * m5
+    )
+
+
+@njit(cache=True)
+def cum_times(
+    beta: float, k_switch: int, t_need: float, prev: np.ndarray
+) -> np.ndarray:
+    """
+    Cumulative segment times T_k - T_0 for k = 1, 2, ..., extended until the
+    last entry reaches t_need. These depend only on beta, not on t, so a
+    caller can cache the array per c and pass it back in as `prev` to grow
+    it instead of recomputing the prefix.
+    """
+    n = prev.shape[0]
+    acc = prev[n - 1] if n > 0 else 0.0
+    cap = max(64, 2 * n)
+    out = np.empty(cap)
+    out[:n] = prev
+    i = n
+    k = n + 1
+    while acc < t_need:
+        if i >= cap:
+            cap *= 2
+            tmp = np.empty(cap)
+            tmp[:i] = out[:i]
+            out = tmp
+        denom = math.sqrt(k + beta)
+        m = 1.0 / (k + beta)
+        if k < k_switch:
+            Kk = _ellipk(m)
+        else:
+            Kk = ellipk_series(m)
+        acc += Kk / denom
+        out[i] = acc
+        i += 1
+        k += 1
+    return out[:i].copy()
+
+
+@njit(cache=True)
+def x_seg(t_rem: float, c: float, beta: float, k: int, acc_time: float) -> float:
+    """x(t,c) inside segment k >= 1, given t_rem = t - T_0 and acc_time = T_{k-1} - T_0."""
+    denom = math.sqrt(k + beta)
+    m = 1.0 / (k + beta)
+    Kk = _ellipk(m)
+    tau = t_rem - acc_time
+    u_arg = Kk - denom * tau
+    sn = _ellipj_sn(u_arg, m)
+    sn = 1.0 if sn > 1.0 else (-1.0 if sn < -1.0 else sn)
+    u = k * PI + PI_OVER_2 - 2.0 * math.asin(sn)
+    return u + c
+
+
+@njit(cache=True)
+def x_tail_bisect(t_rem: float, c: float, beta: float, ct: np.ndarray) -> float:
+    """
+    x(t,c) past segment 0 by bisection on a precomputed cum_times array
+    (O(log k) instead of an O(k) walk when the array is cached).
+    """
+    k = np.searchsorted(ct, t_rem - 1e-15) + 1
+    acc_time = ct[k - 2] if k >= 2 else 0.0
+    return x_seg(t_rem, c, beta, k, acc_time)
+
+
+@njit(cache=True)
+def _sign(v: float) -> float:
+    if v > 0.0:
+        return 1.0
+    if v < 0.0:
+        return -1.0
+    return 0.0
+
+
+def make_specialized(k_switch: int):
+    """
+    Compile x(t,c) and its bounded maximizer with k_switch frozen in.
+
+    Numba treats closure free variables as compile-time constants, so
+    the exact-vs-series branch in the segment walk is resolved when the
+    closure is compiled, not tested every iteration. One pair of
+    compiled kernels per k_switch value; callers go through get_kernel,
+    which memoizes them.
+    """
+    ks = int(k_switch)
+
+    @njit
+    def x_fast(t: float, c: float) -> float:
+        """Closed-form piecewise x(t,c), k_switch specialized."""
+        if abs(c) >= PI_OVER_2 - 1e-14:
+            return 0.0
+
+        beta = 0.5 * (1.0 + math.sin(c))  # in (0,1)
+        K0 = _ellipk(beta)
+
+        # Segment 0 (u in [-pi/2, pi/2])
+        if t <= K0:
+            u_arg = K0 - t
+            sn = _ellipj_sn(u_arg, beta)
+            s = math.sqrt(beta) * sn
+            s = 1.0 if s > 1.0 else (-1.0 if s < -1.0 else s)
+            u = PI_OVER_2 - 2.0 * math.asin(s)
+            return u + c
+
+        # Later segments k>=1: linear walk over segment times
+        t_rem = t - K0
+        acc_time = 0.0
+        k = 1
+        while True:
+            denom = math.sqrt(k + beta)
+            m = 1.0 / (k + beta)
+            if k < ks:
+                Kk = _ellipk(m)
+            else:
+                Kk = ellipk_series(m)
+            dt_seg = Kk / denom
+
+            if acc_time + dt_seg >= t_rem - 1e-15:
+                tau = t_rem - acc_time
+                if k >= ks:
+                    # The locator used the series; the finish needs exact K.
+                    Kk = _ellipk(m)
+                u_arg = Kk - denom * tau
+                sn = _ellipj_sn(u_arg, m)
+                sn = 1.0 if sn > 1.0 else (-1.0 if sn < -1.0 else sn)
+                u = k * PI + PI_OVER_2 - 2.0 * math.asin(sn)
+                return u + c
+
+            acc_time += dt_seg
+            k += 1
+
+    brent = _make_brent(x_fast)
+
+    @njit
+    def brent_vec(a_arr, b_arr, xatol, t):
+        """
+        Run the bounded maximizer over a whole batch of intervals in one
+        compiled call: (c_hats, f_hats) with one Python->native dispatch
+        for the batch instead of two per interval.
+        """
+        n = a_arr.shape[0]
+        c_hats = np.empty(n)
+        f_hats = np.empty(n)
+        for i in range(n):
+            c_hats[i] = brent(a_arr[i], b_arr[i], xatol, t)
+            f_hats[i] = x_fast(t, c_hats[i])
+        return c_hats, f_hats
+
+    return x_fast, brent, brent_vec
+
+
+_kernels: dict = {}
+
+
+def get_kernel(k_switch: int):
+    """Memoized (x_fast, brent_bounded, brent_vec) triple for a given k_switch."""
+    try:
+        return _kernels[k_switch]
+    except KeyError:
+        _kernels[k_switch] = make_specialized(k_switch)
+        return _kernels[k_switch]
+
+
+def _make_brent(x_fast):
+    """
+    Maximize x(t,c) for c in [a,b]; returns the maximizer.
+
+    Port of scipy's bounded minimization (golden section + parabolic
+    fit, as in optimize._minimize_scalar_bounded) applied to -x(t,c),
+    with the objective call compiled in so each function evaluation
+    stays native instead of re-entering Python.
+    """
+
+    @njit
+    def brent_bounded(a: float, b: float, xatol: float, t: float) -> float:
+        maxiter = 500
+        sqrt_eps = math.sqrt(2.2e-16)
+        golden_mean = 0.5 * (3.0 - math.sqrt(5.0))
+
+        fulc = a + golden_mean * (b - a)
+        nfc, xf = fulc, fulc
+        rat = 0.0
+        e = 0.0
+        x = xf
+        fx = -x_fast(t, x)
+        num = 1
+        ffulc, fnfc = fx, fx
+        xm = 0.5 * (a + b)
+        tol1 = sqrt_eps * abs(xf) + xatol / 3.0
+        tol2 = 2.0 * tol1
+
+        while abs(xf - xm) > (tol2 - 0.5 * (b - a)):
+            golden = True
+            # Check for parabolic fit
+            if abs(e) > tol1:
+                golden = False
+                r = (xf - nfc) * (fx - ffulc)
+                q = (xf - fulc) * (fx - fnfc)
+                p = (xf - fulc) * q - (xf - nfc) * r
+                q = 2.0 * (q - r)
+                if q > 0.0:
+                    p = -p
+                q = abs(q)
+                r = e
+                e = rat
+
+                # Accept the parabola if it lands inside the bracket
+                if (abs(p) < abs(0.5 * q * r)) and (p > q * (a - xf)) and (
+                    p < q * (b - xf)
+                ):
+                    rat = p / q
+                    x = xf + rat
+                    if ((x - a) < tol2) or ((b - x) < tol2):
+                        si = _sign(xm - xf) + (1.0 if xm == xf else 0.0)
+                        rat = tol1 * si
+                else:
+                    golden = True
+
+            if golden:  # golden-section step
+                if xf >= xm:
+                    e = a - xf
+                else:
+                    e = b - xf
+                rat = golden_mean * e
+
+            si = _sign(rat) + (1.0 if rat == 0.0 else 0.0)
+            x = xf + si * max(abs(rat), tol1)
+            fu = -x_fast(t, x)
+            num += 1
+
+            if fu <= fx:
+                if x >= xf:
+                    a = xf
+                else:
+                    b = xf
+                fulc, ffulc = nfc, fnfc
+                nfc, fnfc = xf, fx
+                xf, fx = x, fu
+            else:
+                if x < xf:
+                    a = x
+                else:
+                    b = x
+                if (fu <= fnfc) or (nfc == xf):
+                    fulc, ffulc = nfc, fnfc
+                    nfc, fnfc = x, fu
+                elif (fu <= ffulc) or (fulc == xf) or (fulc == nfc):
+                    fulc, ffulc = x, fu
+
+            xm = 0.5 * (a + b)
+            tol1 = sqrt_eps * abs(xf) + xatol / 3.0
+            tol2 = 2.0 * tol1
+
+            if num >= maxiter:
+                break
+
+        return xf
+
+    return brent_bounded
@@ -0,0 +1,89 @@
+"""
+Batched Hurwitz zeta for half-integer-spaced exponents.
+
+F_limit (optimal_c_inf.py) and Hprime_beta (optimal_c_inf_prec.py) need
+zeta(s0 + n, q) for n = 0..count-1 at a shared q. mp.zeta computes each
+value from scratch; here one Euler-Maclaurin evaluation serves the whole
+family: the expensive powers (q+k)^(-s) are formed once at s = s0 via
+mp.power and shifted to higher exponents by cheap multiplications with
+1/(q+k).
+"""
+
+import mpmath as mp
+
+
+def zeta_batch(q, s0, count):
+    """
+    Return [zeta(s0, q), zeta(s0+1, q), ..., zeta(s0+count-1, q)].
+
+    Requires q > 0 and s0 + n != 1 for every n; accurate to roughly the
+    working precision.
+    """
+    if count <= 0:
+        return []
+    eps = mp.mpf(10) ** (-(mp.mp.dps + 5))
+    s_max = s0 + count - 1
+
+    # Split point P = q + n_direct, chosen so the Euler-Maclaurin
+    # correction series can reach working precision *relative to*
+    # zeta(s, q) ~ q^(-s), which sits a factor (P/q)^s above the
+    # P^(-s) scale of the correction terms. Solved by fixed point.
+    D = (mp.mp.dps + 15) * mp.log(10)
+    P = max(q, D / (2 * mp.pi))
+    for _ in range(8):
+        P = max(q, (D + 2 * s_max * mp.log(P / q)) / (2 * mp.pi))
+    n_direct = max(0, int(mp.ceil(P - q)))
+    P = q + n_direct
+
+    # Direct part sum_{k<n_direct} (q+k)^(-s): one mp.power per k,
+    # shared across the family via repeated multiplication by 1/(q+k)
+    sums = [mp.mpf(0) for _ in range(count)]
+    for k in range(n_direct):
+        w = q + k
+        inv = 1 / w
+        term = mp.power(w, -s0)
+        for j in range(count):
+            sums[j] += term
+            term *= inv
+
+    invP = 1 / P
+    invP2 = invP * invP
+    baseP = mp.power(P, -s0)  # P^(-(s0+j)), shifted per j
+
+    # B_{2i}/(2i)! factors, shared across the whole family
+    bfac = []
+
+    def get_bfac(i):
+        while len(bfac) < i:
+            two_i = 2 * (len(bfac) + 1)
+            bfac.append(mp.bernoulli(two_i) / mp.factorial(two_i))
+        return bfac[i - 1]
+
+    out = []
+    for j in range(count):
+        s = s0 + j
+        acc = sums[j] + P * baseP / (s - 1) + baseP / 2
+
+        # Correction terms B_{2i}/(2i)! * (s)_{2i-1} * P^(-s-2i+1)
+        poch = s
+        pw = baseP * invP
+        prev = mp.inf
+        i = 1
+        while True:
+            term = get_bfac(i) * poch * pw
+            acc += term
+            if abs(term) < abs(acc) * eps:
+                break
+            if abs(term) > prev:
+                # past the minimum of the asymptotic series without
+                # converging; the split was too tight for this s, be safe
+                acc = mp.zeta(s, q)
+                break
+            prev = abs(term)
+            poch *= (s + 2 * i - 1) * (s + 2 * i)
+            pw *= invP2
+            i += 1
+
+        out.append(acc)
+        baseP *= invP
+    return out
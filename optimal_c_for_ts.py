@@ -10,15 +10,18 @@ This script produces:
 Hyperparameters are grouped in CONFIG below.
 
 Dependencies:
-  numpy, scipy, plotly, matplotlib
+  numpy, numba, joblib, plotly, matplotlib
 """
 
-import math, time, random
+import math, time
 import numpy as np
-from scipy import special, optimize
+from joblib import Parallel, delayed
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
 
+from _x_numba import cum_times, get_kernel, x_tail_bisect
+from elliptic_nb import ellipj_sn_arr, ellipk_arr
+
 
 # -----------------------
 # CONFIG (edit these)
@@ -36,11 +39,14 @@ CONFIG = dict(
     timing_t=100.0,  # time a single argmax at this t (usually the max t)
     # Argmax hyperparameters
     n_grid=300,  # grid scan resolution over c in [-pi/2, pi/2]
+    n_peaks=5,  # refine only the top-K grid peaks by value
     n_rand=100,  # number of random multi-start refinement intervals
     xatol=1e-9,  # tolerance for local bounded optimizer (minimize_scalar)
     # Speed/accuracy tradeoff in x(t,c) evaluation:
     # segment locator uses exact ellipk for k < k_switch, series for k>=k_switch
     k_switch=10,
+    # Parallelism over the t-sweep (-1 = all cores)
+    n_jobs=-1,
     # Output files
     out_html="optimal_c_vs_t_100.html",
     out_png="optimal_c_vs_t_100.png",
@@ -53,127 +59,120 @@ CONFIG = dict(
 PI = math.pi
 PI_OVER_2 = math.pi / 2.0
 
-
-def ellipk_series(m: float) -> float:
-    """Series approximation of K(m) for small m (very accurate for m<=0.1)."""
-    m2 = m * m
-    m3 = m2 * m
-    m4 = m2 * m2
-    m5 = m4 * m
-    return PI_OVER_2 * (
-        1.0
-        + 0.25 * m
-        + (9.0 / 64.0) * m2
-        + (25.0 / 256.0) * m3
-        + (1225.0 / 16384.0) * m4
-        + (3969.0 / 65536.0) * m5
-    )
+# Per-c cache of cumulative segment times (see cum_times). Keyed by the exact
+# c value, which is what makes it hit: the grid c's are identical for every t.
+_CUM_CACHE: dict = {}
 
 
-def x_exact_piecewise_fast(t: float, c: float, k_switch: int = 10) -> float:
+def x_vec(t: float, cs: np.ndarray, k_switch: int = 10) -> np.ndarray:
     """
-    Closed-form x(t,c) using the piecewise Jacobi-elliptic solution,
-    with a fast segment locator for large t.
+    Vectorized x(t,c) over an array of c values at a shared t.
+
+    Segment 0 (t <= K(beta)) is evaluated in whole-array compiled loops;
+    points that have already left segment 0 fall back to the scalar
+    piecewise evaluator (rare at moderate t).
     """
-    if abs(c) >= PI_OVER_2 - 1e-14:
-        return 0.0
-
-    beta = 0.5 * (1.0 + math.sin(c))  # in (0,1)
-    K0 = float(special.ellipk(beta))
-
-    # Segment 0 (u in [-pi/2, pi/2])
-    if t <= K0:
-        u_arg = K0 - t
-        sn = float(special.ellipj(u_arg, beta)[0])
-        s = math.sqrt(beta) * sn
-        s = 1.0 if s > 1.0 else (-1.0 if s < -1.0 else s)
-        u = PI_OVER_2 - 2.0 * math.asin(s)
-        return u + c
-
-    # Later segments k>=1
-    t_rem = t - K0
-    acc_time = 0.0
-    k = 1
-    while True:
-        denom = math.sqrt(k + beta)
-        m = 1.0 / (k + beta)
-        if k < k_switch:
-            Kk = float(special.ellipk(m))
-        else:
-            Kk = ellipk_series(m)
-        dt_seg = Kk / denom
-
-        if acc_time + dt_seg >= t_rem - 1e-15:
-            tau = t_rem - acc_time
-            mk = 1.0 / (k + beta)
-            K_exact = float(special.ellipk(mk))
-            u_arg = K_exact - math.sqrt(k + beta) * tau
-            sn = float(special.ellipj(u_arg, mk)[0])
-            sn = 1.0 if sn > 1.0 else (-1.0 if sn < -1.0 else sn)
-            u = k * PI + PI_OVER_2 - 2.0 * math.asin(sn)
-            return u + c
-
-        acc_time += dt_seg
-        k += 1
+    cs = np.asarray(cs, dtype=float)
+    out = np.zeros_like(cs)
+    interior = np.abs(cs) < PI_OVER_2 - 1e-14
+    if not np.any(interior):
+        return out
+
+    ci = cs[interior]
+    beta = 0.5 * (1.0 + np.sin(ci))
+    K0 = ellipk_arr(beta)
+
+    vals = np.empty_like(ci)
+
+    # Segment 0 points, one compiled sn loop for the whole batch
+    m0 = t <= K0
+    if np.any(m0):
+        sn = ellipj_sn_arr(K0[m0] - t, beta[m0])
+        s = np.clip(np.sqrt(beta[m0]) * sn, -1.0, 1.0)
+        vals[m0] = PI_OVER_2 - 2.0 * np.arcsin(s) + ci[m0]
+
+    # Later segments: locate the segment by bisection on cached cumulative
+    # segment times (t-independent, and the c-grid repeats across the whole
+    # t-sweep), then finish with a single Jacobi evaluation per point
+    for j in np.flatnonzero(~m0):
+        c_j = ci[j]
+        beta_j = beta[j]
+        t_rem = t - K0[j]
+        ct = _CUM_CACHE.get(c_j)
+        if ct is None or ct[-1] < t_rem:
+            prev = ct if ct is not None else np.empty(0)
+            ct = cum_times(beta_j, k_switch, t_rem, prev)
+            _CUM_CACHE[c_j] = ct
+        vals[j] = x_tail_bisect(t_rem, c_j, beta_j, ct)
+
+    out[interior] = vals
+    return out
 
 
 def argmax_c_for_t(
-    t: float, *, n_grid: int, n_rand: int, xatol: float, seed: int, k_switch: int
+    t: float,
+    *,
+    n_grid: int,
+    n_peaks: int,
+    n_rand: int,
+    xatol: float,
+    seed: int,
+    k_switch: int,
 ):
     """
     Independent argmax over c in [-pi/2, pi/2]:
       - grid scan
-      - refine around local peaks on the grid
-      - many random refinement intervals (multi-start)
+      - refine around the top-n_peaks local peaks on the grid
+      - random refinement intervals as a multi-start safety net
+        (scaled down when the best peak is clearly isolated)
       - bounded 1D local optimization in each interval
     """
     if t <= 1e-14:
         return 0.0, 0.0
 
-    rng = random.Random(seed)
+    # Kernels specialized (and memoized) for this k_switch
+    x_fast, brent, brent_vec = get_kernel(k_switch)
+
+    rng = np.random.default_rng(seed)
     lo, hi = -PI_OVER_2, PI_OVER_2
 
     cs_grid = np.linspace(lo, hi, n_grid)
-    fs_grid = np.array(
-        [
-            x_exact_piecewise_fast(float(t), float(c), k_switch=k_switch)
-            for c in cs_grid
-        ],
-        dtype=float,
-    )
-
-    intervals = [(lo, float(cs_grid[1])), (float(cs_grid[-2]), hi)]
-    for i in range(1, n_grid - 1):
-        if fs_grid[i] >= fs_grid[i - 1] and fs_grid[i] >= fs_grid[i + 1]:
-            intervals.append((float(cs_grid[i - 1]), float(cs_grid[i + 1])))
+    fs_grid = x_vec(t, cs_grid, k_switch=k_switch)
+
+    f = fs_grid
+    peaks = np.flatnonzero((f[1:-1] >= f[:-2]) & (f[1:-1] >= f[2:])) + 1
+
+    # Only the best few peaks are worth a local optimization; the
+    # objective is empirically unimodal in c, so the winner is almost
+    # always in the top peak's neighborhood.
+    peak_fs = np.sort(fs_grid[peaks])[::-1]
+    if peaks.size > n_peaks:
+        order = np.argsort(fs_grid[peaks])[::-1]
+        peaks = peaks[order[:n_peaks]]
+
+    # Shrink the random safety net when the top peak is well separated
+    # from the runner-up (gap above the grid's local variation)
+    n_rand_eff = n_rand
+    if peaks.size >= 1:
+        noise = np.median(np.abs(np.diff(fs_grid)))
+        if peaks.size == 1 or peak_fs[0] - peak_fs[1] > 3.0 * noise:
+            n_rand_eff = min(n_rand, 10)
 
     step = (hi - lo) / (n_grid - 1)
     w = 2.5 * step
-    for _ in range(n_rand):
-        c0 = rng.uniform(lo, hi)
-        a = max(lo, c0 - w)
-        b = min(hi, c0 + w)
-        if b - a > 1e-12:
-            intervals.append((a, b))
-
-    best_c = None
-    best_f = -1e300
-
-    def neg_f(cc):
-        return -x_exact_piecewise_fast(float(t), float(cc), k_switch=k_switch)
-
-    for a, b in intervals:
-        if b - a < 1e-12:
-            continue
-        res = optimize.minimize_scalar(
-            neg_f, bounds=(a, b), method="bounded", options={"xatol": xatol}
-        )
-        c_hat = float(res.x)
-        f_hat = x_exact_piecewise_fast(float(t), c_hat, k_switch=k_switch)
-        if f_hat > best_f:
-            best_f, best_c = f_hat, c_hat
+    c0s = rng.uniform(lo, hi, size=n_rand_eff)
+
+    # Interval bounds as two flat arrays (edge, peak, random) rather than
+    # a list of tuples; degenerate intervals drop out with one mask
+    a_arr = np.concatenate([[lo], cs_grid[peaks - 1], [cs_grid[-2]], np.maximum(lo, c0s - w)])
+    b_arr = np.concatenate([[cs_grid[1]], cs_grid[peaks + 1], [hi], np.minimum(hi, c0s + w)])
+    keep = b_arr - a_arr > 1e-12
+    a_arr, b_arr = a_arr[keep], b_arr[keep]
 
-    return best_c, best_f
+    # One compiled call optimizes every interval
+    c_hats, f_hats = brent_vec(a_arr, b_arr, xatol, t)
+    i_best = int(np.argmax(f_hats))
+    return c_hats[i_best].item(), f_hats[i_best].item()
 
 
 def make_t_values(cfg):
@@ -202,6 +201,7 @@ def main():
         _ = argmax_c_for_t(
             t_timing,
             n_grid=cfg["n_grid"],
+            n_peaks=cfg["n_peaks"],
             n_rand=cfg["n_rand"],
             xatol=cfg["xatol"],
             seed=seed,
@@ -217,23 +217,22 @@ def main():
 
     ts = make_t_values(cfg)
 
-    cs_star = np.empty_like(ts)
-    xs_star = np.empty_like(ts)
-
-    for i, t in enumerate(ts):
-        seed_i = 20_000_000 + i * 10007  # independent seed per t
-        c_star, x_star = argmax_c_for_t(
-            float(t),
+    # Each t is independent (own seed), so the sweep parallelizes trivially.
+    # Processes rather than threads: the inner loop is partly pure Python.
+    results = Parallel(n_jobs=cfg["n_jobs"], verbose=5)(
+        delayed(argmax_c_for_t)(
+            t,
             n_grid=cfg["n_grid"],
+            n_peaks=cfg["n_peaks"],
             n_rand=cfg["n_rand"],
             xatol=cfg["xatol"],
-            seed=seed_i,
+            seed=20_000_000 + i * 10007,  # independent seed per t
             k_switch=cfg["k_switch"],
         )
-        cs_star[i] = c_star
-        xs_star[i] = x_star
-        if (i + 1) % 50 == 0:
-            print(f"Optimized {i + 1}/{len(ts)} points...")
+        for i, t in enumerate(ts)
+    )
+    cs_star = np.array([c for c, _ in results])
+    xs_star = np.array([x for _, x in results])
 
     c_min = float(np.min(cs_star))
     c_max = float(np.max(cs_star))
@@ -242,11 +241,9 @@ def main():
     y_lo = max(-PI_OVER_2, c_min - margin)
     y_hi = min(PI_OVER_2, c_max + margin)
 
-    # Plotly interactive
-    hover_text = [
-        f"t={t:.6f}<br>c*={c:.9f} rad<br>x(t,c*)={xv:.6f}"
-        for t, c, xv in zip(ts, cs_star, xs_star)
-    ]
+    # Plotly interactive; one hovertemplate string + a customdata matrix
+    # instead of a per-point list of formatted strings
+    customdata = np.stack([ts, cs_star, xs_star], axis=1)
 
     fig = go.Figure()
     fig.add_trace(
@@ -266,8 +263,12 @@ def main():
             mode="markers",
             marker=dict(color="red", size=5),
             name="Optimized points",
-            text=hover_text,
-            hoverinfo="text",
+            customdata=customdata,
+            hovertemplate=(
+                "t=%{customdata[0]:.6f}<br>"
+                "c*=%{customdata[1]:.9f} rad<br>"
+                "x(t,c*)=%{customdata[2]:.6f}<extra></extra>"
+            ),
         )
     )
     fig.update_layout(
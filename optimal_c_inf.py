@@ -1,38 +1,68 @@
 import mpmath as mp
 
+from hurwitz import zeta_batch
+from optimal_c_inf_prec import Hprime_beta, precompute_a
 
-def a_coeff(n):
-    # a_n = (C(2n,n)^2) / 16^n
-    return mp.binomial(2 * n, n) ** 2 / (16**n)
+
+def F_const(J):
+    """
+    c-independent pieces of F_limit for a given J: the subtracted
+    sum_{k=1..J} pi/(2 sqrt(k)) and zeta(1/2, J+1). Compute once and pass to
+    F_limit when evaluating many c's (coarse scan, root finding).
+    """
+    sub = sum(mp.pi / (2 * mp.sqrt(k)) for k in range(1, J + 1))
+    return sub, mp.zeta(mp.mpf("0.5"), J + 1)
 
 
-def F_limit(c, J=80, N=20, a=None):
+def F_limit(c, J=80, N=20, a=None, const=None):
     """
     Limit objective F(c) whose minimizer is c_infty.
 
     J: number of 'exact' terms in the finite sum
     N: number of K-series coefficients used in the tail
+    const: optional output of F_const(J), shared across evaluations
     """
     if a is None:
-        a = [a_coeff(n) for n in range(N + 1)]
+        a = precompute_a(N + 1)
+    if const is None:
+        const = F_const(J)
+    sub, zeta_half = const
 
     beta = (1 + mp.sin(c)) / 2
+    q = J + 1 + beta
 
     # T0 = K(beta)
     F = mp.ellipk(beta)
 
     # Finite exact part: sum_{k=1..J} [ΔT_k - π/(2√k)]
     for k in range(1, J + 1):
-        F += mp.ellipk(1 / (k + beta)) / mp.sqrt(k + beta) - mp.pi / (2 * mp.sqrt(k))
+        kb = k + beta
+        F += mp.ellipk(1 / kb) / mp.sqrt(kb)
+    F -= sub
 
     # Tail (k > J), accelerated with Hurwitz zeta
     # n=0 piece corresponds to (k+beta)^(-1/2); we need the difference to k^(-1/2)
-    tail = mp.zeta(mp.mpf("0.5"), J + 1 + beta) - mp.zeta(mp.mpf("0.5"), J + 1)
-
-    # n>=1 pieces from K-series: a_n (k+beta)^(-(n+1/2))
+    tail = mp.zeta(mp.mpf("0.5"), q) - zeta_half
+
+    # n>=1 pieces from K-series: a_n (k+beta)^(-(n+1/2)). Truncate where
+    # the terms fall below roundoff for the working precision, bounding
+    # zeta(n+3/2, q) <= q^(-n-1/2)/(n+1/2) + q^(-n-3/2); the cut has to
+    # be picked before the batch since zeta_batch evaluates the whole
+    # family in one Euler-Maclaurin pass. N stays as an upper cap.
+    eps = mp.mpf(10) ** (-(mp.mp.dps + 5))
+    invq = 1 / q
+    pw = mp.power(q, mp.mpf("-1.5"))  # q^(-n-1/2) at n=1
+    n_use = N
     for n in range(1, N + 1):
-        s = n + mp.mpf("0.5")
-        tail += a[n] * mp.zeta(s, J + 1 + beta)
+        if a[n] * pw * (1 / (n + mp.mpf("0.5")) + invq) < eps:
+            n_use = n
+            break
+        pw *= invq
+
+    # All n_use Hurwitz zetas in one batched Euler-Maclaurin pass
+    zs = zeta_batch(q, mp.mpf("1.5"), n_use)
+    for n in range(1, n_use + 1):
+        tail += a[n] * zs[n - 1]
 
     F += (mp.pi / 2) * tail
     return F
@@ -40,8 +70,9 @@ def F_limit(c, J=80, N=20, a=None):
 
 def c_infty(dps=80, J=120, N=20):
     mp.mp.dps = dps
-    a = [a_coeff(n) for n in range(N + 1)]
-    F = lambda cc: F_limit(cc, J=J, N=N, a=a)
+    a = precompute_a(N + 1)
+    const = F_const(J)
+    F = lambda cc: F_limit(cc, J=J, N=N, a=a, const=const)
 
     # Coarse scan to get a robust initial guess
     lo = mp.mpf("0.2")
@@ -51,8 +82,14 @@ def c_infty(dps=80, J=120, N=20):
     i0 = min(range(len(vals)), key=lambda i: vals[i])
     c0 = grid[i0]
 
-    # Solve F'(c)=0 near the minimizer (use a bracketed pair)
-    dF = lambda cc: mp.diff(F, cc)
+    # Solve F'(c)=0 near the minimizer (use a bracketed pair).
+    # F(c) = H(beta(c)) with beta = (1+sin c)/2, so the analytic
+    # derivative H'(beta) * cos(c)/2 replaces mp.diff's Richardson
+    # extrapolation (~7 F evaluations per derivative).
+    A = precompute_a(N + 6)
+    dF = lambda cc: (
+        Hprime_beta((1 + mp.sin(cc)) / 2, J, N, A)[0] * mp.cos(cc) / 2
+    )
     return mp.findroot(dF, (c0 - mp.mpf("0.05"), c0 + mp.mpf("0.05")))
 
 
@@ -1,5 +1,7 @@
 import mpmath as mp
 
+from hurwitz import zeta_batch
+
 
 # ---------- Elliptic K-series coefficient a_n ----------
 def a_coeff(n: int) -> mp.mpf:
@@ -8,7 +10,13 @@ def a_coeff(n: int) -> mp.mpf:
 
 
 def precompute_a(N: int):
-    return [a_coeff(n) for n in range(N)]
+    # a_0 = 1 and a_{n+1} = a_n * ((2n+1)/(2n+2))^2: one multiplication per
+    # coefficient instead of a gamma-based binomial plus a power
+    # (agrees with a_coeff to working precision)
+    a = [mp.mpf(1)]
+    for n in range(N - 1):
+        a.append(a[-1] * (mp.mpf(2 * n + 1) / (2 * n + 2)) ** 2)
+    return a
 
 
 # ---------- dK/dm for complete elliptic K(m) (parameter m) ----------
@@ -21,9 +29,11 @@ def dK_dm(m: mp.mpf) -> mp.mpf:
 
 # ---------- derivative wrt s of g(s) = K(1/s)/sqrt(s) ----------
 def gprime_term(s: mp.mpf) -> mp.mpf:
+    # K(m) is shared between the K term and dK/dm, so evaluate it once
     m = 1 / s
     K = mp.ellipk(m)
-    dK = dK_dm(m)
+    E = mp.ellipe(m)
+    dK = (E - (1 - m) * K) / (2 * m * (1 - m))
     return (-mp.mpf("0.5")) * s ** (-mp.mpf("1.5")) * K - s ** (-mp.mpf("2.5")) * dK
 
 
@@ -48,12 +58,12 @@ def Hprime_beta(beta: mp.mpf, M: int, L: int, A) -> tuple[mp.mpf, mp.mpf]:
     for k in range(1, M + 1):
         val += gprime_term(k + beta)
 
-    # tail part (truncated)
+    # tail part (truncated); all L zetas at s = n + 3/2 in one batch
     q = M + 1 + beta
+    zs = zeta_batch(q, mp.mpf("1.5"), L)
     tail = mp.mpf("0")
     for n in range(L):
-        s = n + mp.mpf("1.5")  # n + 3/2
-        tail += A[n] * (n + mp.mpf("0.5")) * mp.zeta(s, q)
+        tail += A[n] * (n + mp.mpf("0.5")) * zs[n]
     val += (-pi / 2) * tail
 
     # explicit remainder bound for n >= L
@@ -87,13 +97,34 @@ def sign_interval(val: mp.mpf, err: mp.mpf) -> int:
     return 0
 
 
+# ---------- powers of 10, built once and reused ----------
+_pow10 = {0: mp.mpf(1)}
+
+
+def get_pow10(d: int) -> mp.mpf:
+    """
+    10^d as mpf, cached. Filled by repeated multiplication by 10, which
+    is exact as long as d stays below the working precision (always the
+    case here: maxd <= target_digits while dps carries a +120 margin),
+    and avoids re-running mp.power at every binary-search step.
+    """
+    if d not in _pow10:
+        dd = max(_pow10)
+        p = _pow10[dd]
+        while dd < d:
+            dd += 1
+            p = p * 10
+            _pow10[dd] = p
+    return _pow10[d]
+
+
 # ---------- stable decimal digits in an interval ----------
 def stable_decimals(lo: mp.mpf, hi: mp.mpf, maxd: int) -> int:
     """Largest d <= maxd such that floor(lo*10^d) == floor(hi*10^d)."""
     left, right = 0, maxd
     while left < right:
         mid = (left + right + 1) // 2
-        factor = mp.power(10, mid)
+        factor = get_pow10(mid)
         if mp.floor(lo * factor) == mp.floor(hi * factor):
             left = mid
         else:
@@ -162,7 +193,7 @@ def compute_c_infty(target_digits: int = 200, M: int = 50):
     d_stable = stable_decimals(c_lo, c_hi, maxd=target_digits)
 
     # Print only the guaranteed digits: use floor(c_lo*10^d_stable)
-    factor = mp.power(10, d_stable)
+    factor = get_pow10(d_stable)
     common_int = int(mp.floor(c_lo * factor))
     c_str = format_fixed_from_int(common_int, d_stable)
 